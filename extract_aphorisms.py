@@ -1,5 +1,6 @@
 import json
 import os
+import sys
 
 # Load all translations
 files = {
@@ -11,20 +12,24 @@ files = {
     "Zimmern": "corpus/aligned/helen_zimmern.json"
 }
 
+# Only aphorisms 1-50 are printed, so drop the rest while loading
 translations = {}
 for name, f in files.items():
     with open(f) as fp:
         data = json.load(fp)
-        translations[name] = {a["number"]: a["text"] for a in data["aphorisms"]}
+        translations[name] = {a["number"]: a["text"] for a in data["aphorisms"] if 1 <= a["number"] <= 50}
 
-# Extract aphorisms 1-50
+# Extract aphorisms 1-50, collecting the report and writing it in one go
+lines = []
 for num in range(1, 51):
-    print(f"=== APHORISM {num} ===")
+    lines.append(f"=== APHORISM {num} ===")
     for name in ["Gutenberg", "Kaufmann", "Hollingdale", "Norman", "Faber", "Zimmern"]:
         text = translations[name].get(num, "MISSING")
         if text is not None and text != "MISSING":
             preview = text[:500].replace("\n", " ")
-            print(f"{name}: {preview}...")
+            lines.append(f"{name}: {preview}...")
         else:
-            print(f"{name}: MISSING")
-    print()
+            lines.append(f"{name}: MISSING")
+    lines.append("")
+
+sys.stdout.write("\n".join(lines) + "\n")
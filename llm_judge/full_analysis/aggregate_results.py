@@ -3,109 +3,216 @@
 Aggregate LLM-as-Judge batch results into summary statistics.
 """
 
-import json
+import functools
+import heapq
+import pickle
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+
+    def _loads(b):
+        return orjson.loads(b)
+
+    def _dumps(o):
+        return orjson.dumps(o, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(o):
+        return json.dumps(o, indent=2).encode()
+
+# Substring -> canonical translator key. "Kaufman" also matches "Kaufmann".
+_CANON = (
+    ('Kaufman', 'Kaufmann'),
+    ('Hollingdale', 'Hollingdale'),
+    ('Zimmern', 'Zimmern'),
+    ('Faber', 'Faber'),
+    ('Norman', 'Norman'),
+)
+
+NAN = float('nan')
+
+# Translator ids used for the aggregation arrays; names outside this table
+# are assigned further ids as they are seen
+TID = {'Kaufmann': 0, 'Hollingdale': 1, 'Zimmern': 2, 'Faber': 3, 'Norman': 4, 'Gutenberg': 5}
+
+# Keys under which the different batch formats store per-translator scores
+_SCORE_KEYS = ('scores', 'translations', 'translator_scores', 'translators')
+
+# Bump whenever load_batch's normalized output changes shape
+_CACHE_VERSION = 4
+
+@functools.lru_cache(maxsize=None)
+def _canon(name):
+    """Map a translator name variant (e.g. "Walter Kaufman") to its canonical key."""
+    for sub, key in _CANON:
+        if sub in name:
+            return key
+    return name
+
+def _score_row(translator, score_data):
+    """Build a (translator, pf, tp, il) row, with NaN for scores to skip."""
+    pf = score_data.get('philosophical_fidelity')
+    tp = score_data.get('tonal_preservation')
+    il = score_data.get('interpretive_liberty')
+    return (
+        translator,
+        pf if pf is not None and pf > 0 else NAN,  # Skip corrupted entries (score of 2 or less often indicates corpus issues)
+        tp if tp is not None and tp > 0 else NAN,
+        il if il is not None else NAN,
+    )
 
 def load_batch(filepath):
-    """Load a batch file and normalize its format."""
-    with open(filepath) as f:
-        data = json.load(f)
+    """Load a batch file and normalize its format.
+
+    The normalized results are cached next to the batch as
+    ``<name>.cache.pkl`` and reused while the batch file is unchanged
+    and the cache version matches.
+    """
+    filepath = Path(filepath)
+    cache = filepath.with_suffix('.cache.pkl')
+    if cache.exists() and cache.stat().st_mtime >= filepath.stat().st_mtime:
+        with open(cache, 'rb') as f:
+            version, results = pickle.load(f)
+        if version == _CACHE_VERSION:
+            return results
+
+    # Read the whole file in one unbuffered read() and parse the bytes
+    with open(filepath, 'rb', buffering=0) as f:
+        data = _loads(f.read())
 
     analyses = data.get('analyses', [])
     results = []
+    if not analyses:
+        return results
+
+    # Each batch uses a single format, so pick its keys from the first entry
+    first = analyses[0]
+    score_key = next((k for k in _SCORE_KEYS if k in first), None)
+    aph_key = 'aphorism' if 'aphorism' in first else 'aphorism_number'
 
     for a in analyses:
-        # Normalize different formats
-        aph_num = a.get('aphorism') or a.get('aphorism_number')
+        aph_num = a.get(aph_key)
 
-        # Get scores - handle different naming conventions
-        scores = a.get('scores') or a.get('translations') or a.get('translator_scores') or a.get('translators')
+        scores = a.get(score_key)
         if not scores:
             continue
 
-        # Normalize translator names
-        normalized = {}
-        for name, score_data in scores.items():
-            # Handle both "Walter Kaufman" and "Kaufmann" variants
-            if 'Kaufman' in name or name == 'Kaufmann':
-                key = 'Kaufmann'
-            elif 'Hollingdale' in name:
-                key = 'Hollingdale'
-            elif 'Zimmern' in name:
-                key = 'Zimmern'
-            elif 'Faber' in name:
-                key = 'Faber'
-            elif 'Norman' in name:
-                key = 'Norman'
-            else:
-                key = name
-            normalized[key] = score_data
+        # Flatten to (translator, pf, tp, il) rows with canonical names.
+        # Missing translations are stored as null; drop them here. Some
+        # formats wrap each translator's metrics in a nested 'scores' dict,
+        # so unwrap per entry
+        rows = [
+            _score_row(_canon(name), score_data.get('scores', score_data))
+            for name, score_data in scores.items()
+            if isinstance(score_data, dict)
+        ]
 
         results.append({
             'aphorism': aph_num,
-            'scores': normalized,
+            'scores': rows,
             'ranking': a.get('ranking', []),
             'key_issue': a.get('key_issue', '')
         })
 
+    with open(cache, 'wb') as f:
+        pickle.dump((_CACHE_VERSION, results), f, protocol=5)
+
     return results
 
+# Number of translators to report; None reports all of them
+TOP_K = None
+
+METRICS = ('philosophical_fidelity', 'tonal_preservation', 'interpretive_liberty')
+
+def _aggregate(tid, values, n_translators):
+    """Sum and count the non-NaN scores per (translator, metric)."""
+    n_metrics = values.shape[1]
+    sums = np.zeros((n_translators, n_metrics))
+    counts = np.zeros((n_translators, n_metrics), dtype=np.int64)
+    for i in range(tid.size):
+        t = tid[i]
+        for m in range(n_metrics):
+            v = values[i, m]
+            if not np.isnan(v):
+                sums[t, m] += v
+                counts[t, m] += 1
+    return sums, counts
+
+def _aggregate_bincount(tid, values, n_translators):
+    """Vectorized equivalent of _aggregate, used when numba is unavailable."""
+    valid = ~np.isnan(values)
+    sums = np.column_stack([
+        np.bincount(tid, weights=np.where(valid[:, m], values[:, m], 0.0), minlength=n_translators)
+        for m in range(values.shape[1])
+    ])
+    counts = np.column_stack([
+        np.bincount(tid[valid[:, m]], minlength=n_translators)
+        for m in range(values.shape[1])
+    ])
+    return sums, counts
+
+if njit is not None:
+    _aggregate = njit(cache=True)(_aggregate)
+else:
+    _aggregate = _aggregate_bincount
+
 def calculate_statistics(all_analyses):
     """Calculate aggregate statistics across all translators."""
-    translator_scores = defaultdict(lambda: {
-        'philosophical_fidelity': [],
-        'tonal_preservation': [],
-        'interpretive_liberty': [],
-        'top_rankings': 0,
-        'total_ranked': 0
-    })
-
-    for analysis in all_analyses:
-        scores = analysis.get('scores', {})
-        ranking = analysis.get('ranking', [])
-
-        for translator, score_data in scores.items():
-            # Extract scores - handle nested 'scores' key
-            if isinstance(score_data, dict):
-                if 'scores' in score_data:
-                    score_data = score_data['scores']
-
-                pf = score_data.get('philosophical_fidelity')
-                tp = score_data.get('tonal_preservation')
-                il = score_data.get('interpretive_liberty')
-
-                if pf is not None and pf > 0:  # Skip corrupted entries (score of 2 or less often indicates corpus issues)
-                    translator_scores[translator]['philosophical_fidelity'].append(pf)
-                if tp is not None and tp > 0:
-                    translator_scores[translator]['tonal_preservation'].append(tp)
-                if il is not None:
-                    translator_scores[translator]['interpretive_liberty'].append(il)
-
-        # Count top rankings
-        if ranking:
-            # Normalize first ranked name
-            first = ranking[0] if ranking else None
-            if first:
-                for key in translator_scores.keys():
-                    if key in first or first in key:
-                        translator_scores[key]['top_rankings'] += 1
-                        break
-            for t in translator_scores.keys():
-                translator_scores[t]['total_ranked'] += 1
-
-    return dict(translator_scores)
+    # Intern translator names to integer ids and stack the score rows so the
+    # aggregation runs over flat arrays. Invalid scores are stored as NaN.
+    ids = dict(TID)
+    rows = [row for analysis in all_analyses for row in analysis.get('scores', [])]
+    tid = np.fromiter((ids.setdefault(row[0], len(ids)) for row in rows), dtype=np.int64, count=len(rows))
+    values = np.array([row[1:] for row in rows], dtype=np.float64).reshape(-1, len(METRICS))
+
+    # Count top rankings
+    rankings = [analysis['ranking'] for analysis in all_analyses if analysis.get('ranking')]
+    top_rankings = Counter(_canon(ranking[0]) for ranking in rankings if ranking[0])
+
+    sums, counts = _aggregate(tid, values, len(ids))
+    averages = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+
+    # Report translators in order of first appearance
+    names = list(ids)
+    present, first_seen = np.unique(tid, return_index=True)
+    translator_scores = {}
+    for t in present[np.argsort(first_seen)]:
+        translator = names[t]
+        translator_scores[translator] = {
+            'averages': averages[t],
+            'counts': counts[t],
+            'top_rankings': top_rankings[translator],
+            'total_ranked': len(rankings)
+        }
+
+    return translator_scores
 
 def main():
     batch_dir = Path(__file__).parent
 
     # Load all batches
+    # Batch files are independent, so parse them concurrently (orjson
+    # releases the GIL while decoding); map() preserves file order.
     all_analyses = []
-    for batch_file in sorted(batch_dir.glob('batch_*.json')):
-        print(f"Loading {batch_file.name}...")
-        analyses = load_batch(batch_file)
-        all_analyses.extend(analyses)
-        print(f"  -> {len(analyses)} aphorisms")
+    batch_files = sorted(batch_dir.glob('batch_*.json'))
+    with ThreadPoolExecutor() as executor:
+        for batch_file, analyses in zip(batch_files, executor.map(load_batch, batch_files)):
+            print(f"Loading {batch_file.name}...")
+            all_analyses.extend(analyses)
+            print(f"  -> {len(analyses)} aphorisms")
 
     print(f"\nTotal aphorisms analyzed: {len(all_analyses)}")
 
@@ -113,25 +220,21 @@ def main():
     stats = calculate_statistics(all_analyses)
 
     # Compute averages
-    summary = {}
-    for translator, data in stats.items():
-        pf_scores = data['philosophical_fidelity']
-        tp_scores = data['tonal_preservation']
-        il_scores = data['interpretive_liberty']
-
-        summary[translator] = {
-            'philosophical_fidelity_avg': round(sum(pf_scores) / len(pf_scores), 2) if pf_scores else 0,
-            'tonal_preservation_avg': round(sum(tp_scores) / len(tp_scores), 2) if tp_scores else 0,
-            'interpretive_liberty_avg': round(sum(il_scores) / len(il_scores), 2) if il_scores else 0,
+    summary = {
+        translator: {
+            **{f'{m}_avg': round(float(avg), 2) if n else 0
+               for m, avg, n in zip(METRICS, data['averages'], data['counts'])},
             'top_ranking_count': data['top_rankings'],
-            'sample_size': len(pf_scores)
+            'sample_size': int(data['counts'][0])
         }
+        for translator, data in stats.items()
+    }
 
     # Sort by philosophical fidelity
-    sorted_translators = sorted(
+    sorted_translators = heapq.nlargest(
+        len(summary) if TOP_K is None else TOP_K,
         summary.items(),
-        key=lambda x: x[1]['philosophical_fidelity_avg'],
-        reverse=True
+        key=lambda x: x[1]['philosophical_fidelity_avg']
     )
 
     # Print results
@@ -162,8 +265,8 @@ def main():
     }
 
     output_file = batch_dir / 'AGGREGATED_SUMMARY.json'
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(_dumps(output))
 
     print(f"\nResults saved to: {output_file}")
 
@@ -1,5 +1,22 @@
 import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+
+    def _loads(b):
+        return orjson.loads(b)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
 
 # Load all translations
 files = {
@@ -11,36 +28,39 @@ files = {
     "Zimmern": "corpus/aligned/helen_zimmern.json"
 }
 
-translations = {}
-for name, f in files.items():
-    with open(f) as fp:
-        data = json.load(fp)
-        translations[name] = {a["number"]: a["text"] for a in data["aphorisms"]}
+# Order of the translations in each combined aphorism
+NAMES = ("Gutenberg", "Kaufmann", "Hollingdale", "Norman", "Faber", "Zimmern")
+
+def load_translation(item):
+    name, f = item
+    data = _loads(Path(f).read_bytes())
+    return name, {a["number"]: a["text"] for a in data["aphorisms"]}
+
+# The files are independent, so read them concurrently
+with ThreadPoolExecutor(max_workers=len(files)) as executor:
+    translations = dict(executor.map(load_translation, files.items()))
 
 # Save as a single combined file for easier reading
 output = {"aphorisms": []}
 
 for num in range(1, 51):
-    aph = {"number": num, "translations": {}}
-    for name in ["Gutenberg", "Kaufmann", "Hollingdale", "Norman", "Faber", "Zimmern"]:
-        text = translations[name].get(num)
-        if text is not None:
-            aph["translations"][name] = text
-        else:
-            aph["translations"][name] = None
+    # Missing translations are kept as None
+    aph = {"number": num, "translations": {name: translations[name].get(num) for name in NAMES}}
     output["aphorisms"].append(aph)
 
 # Create output directory
 os.makedirs("llm_judge/full_analysis", exist_ok=True)
 
 # Save combined translations
-with open("llm_judge/combined_1_50.json", "w") as fp:
-    json.dump(output, fp, indent=2, ensure_ascii=False)
+with open("llm_judge/combined_1_50.json", "wb") as fp:
+    fp.write(_dumps(output))
 
 print(f"Saved {len(output['aphorisms'])} aphorisms to llm_judge/combined_1_50.json")
 
 # Print summary of what's available
+lines = []
 for aph in output["aphorisms"]:
     available = [k for k, v in aph["translations"].items() if v is not None]
     missing = [k for k, v in aph["translations"].items() if v is None]
-    print(f"Aphorism {aph['number']}: {len(available)} translations available, missing: {missing if missing else 'none'}")
+    lines.append(f"Aphorism {aph['number']}: {len(available)} translations available, missing: {missing if missing else 'none'}")
+sys.stdout.write("\n".join(lines) + "\n")
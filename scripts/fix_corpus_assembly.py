@@ -8,8 +8,24 @@ Fix corpus assembly errors:
 
 import json
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _loads(b):
+        return orjson.loads(b)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
 # Page headers to strip from beginning of aphorisms
 PAGE_HEADERS = [
     r'^Beyond Good and Evil\s*\n',
@@ -30,24 +46,24 @@ GARBAGE_PATTERNS = [
 ]
 
 
+# Each header is stripped at most once, in the order listed above: a chain of
+# optional groups, with MULTILINE so '^' still anchors after a removed header.
+HEADER_RE = re.compile(''.join(f'(?:({p}))?' for p in PAGE_HEADERS), re.IGNORECASE | re.MULTILINE)
+GARBAGE_RE = re.compile('|'.join(f'(?:{p})' for p in GARBAGE_PATTERNS), re.DOTALL)
+
+
 def clean_aphorism_text(text: str) -> tuple[str, list[str]]:
     """Clean page headers from aphorism text. Returns (cleaned_text, list_of_fixes)."""
-    fixes = []
-    original = text
-
     # Strip page headers
-    for pattern in PAGE_HEADERS:
-        match = re.match(pattern, text, re.IGNORECASE)
-        if match:
-            header = match.group(0).strip()
-            text = text[match.end():]
-            fixes.append(f"Removed header: '{header[:50]}...'")
+    match = HEADER_RE.match(text)
+    text = text[match.end():]
+    fixes = [f"Removed header: '{header.strip()[:50]}...'"
+             for header in match.groups() if header is not None]
 
     # Check if result is garbage
     text_stripped = text.strip()
-    for pattern in GARBAGE_PATTERNS:
-        if re.match(pattern, text_stripped, re.DOTALL):
-            return '', [f"Marked as corrupted (matched garbage pattern)"]
+    if GARBAGE_RE.match(text_stripped):
+        return '', [f"Marked as corrupted (matched garbage pattern)"]
 
     # Check if too short to be valid (less than 20 chars of actual content)
     if len(text_stripped) < 20:
@@ -58,8 +74,7 @@ def clean_aphorism_text(text: str) -> tuple[str, list[str]]:
 
 def fix_corpus_file(filepath: Path) -> dict:
     """Fix assembly errors in a corpus file."""
-    with open(filepath) as f:
-        data = json.load(f)
+    data = _loads(filepath.read_bytes())
 
     stats = {
         'file': filepath.name,
@@ -89,8 +104,8 @@ def fix_corpus_file(filepath: Path) -> dict:
                 aph['text'] = ''  # Mark as empty/corrupted
 
     # Save fixed file
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(filepath, 'wb') as f:
+        f.write(_dumps(data))
 
     return stats
 
@@ -98,35 +113,36 @@ def fix_corpus_file(filepath: Path) -> dict:
 def main():
     corpus_dir = Path('corpus/aligned')
 
-    print('=' * 70)
-    print('CORPUS ASSEMBLY FIX REPORT')
-    print('=' * 70)
-
     total_headers = 0
     total_corrupted = 0
 
-    for filepath in sorted(corpus_dir.glob('*.json')):
-        stats = fix_corpus_file(filepath)
+    # Files are independent, so fix them in parallel and report in order
+    with ProcessPoolExecutor() as executor:
+        all_stats = list(executor.map(fix_corpus_file, sorted(corpus_dir.glob('*.json'))))
 
+    # Build the whole report and write it once
+    lines = ['=' * 70, 'CORPUS ASSEMBLY FIX REPORT', '=' * 70]
+
+    for stats in all_stats:
         if stats['headers_stripped'] > 0 or stats['marked_corrupted'] > 0:
-            print(f"\n{stats['translator']}:")
-            print(f"  Headers stripped: {stats['headers_stripped']}")
-            print(f"  Marked corrupted: {stats['marked_corrupted']}")
+            lines.append(f"\n{stats['translator']}:")
+            lines.append(f"  Headers stripped: {stats['headers_stripped']}")
+            lines.append(f"  Marked corrupted: {stats['marked_corrupted']}")
 
             if stats['fixes']:
-                print("  Details:")
+                lines.append("  Details:")
                 for fix in stats['fixes'][:5]:  # Show first 5
-                    print(f"    §{fix['aphorism']}: {fix['fix']}")
+                    lines.append(f"    §{fix['aphorism']}: {fix['fix']}")
                 if len(stats['fixes']) > 5:
-                    print(f"    ... and {len(stats['fixes']) - 5} more")
+                    lines.append(f"    ... and {len(stats['fixes']) - 5} more")
 
         total_headers += stats['headers_stripped']
         total_corrupted += stats['marked_corrupted']
 
-    print('\n' + '=' * 70)
-    print(f'TOTAL: {total_headers} headers stripped, {total_corrupted} entries marked corrupted')
-    print('=' * 70)
-
+    lines.append('\n' + '=' * 70)
+    lines.append(f'TOTAL: {total_headers} headers stripped, {total_corrupted} entries marked corrupted')
+    lines.append('=' * 70)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == '__main__':
     main()
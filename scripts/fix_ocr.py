@@ -6,8 +6,30 @@ Common pattern: 'li' scanned as 'h' (e.g., 'life' -> 'hfe')
 
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import orjson
+
+    def _loads(b):
+        return orjson.loads(b)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
 # OCR replacement patterns (wrong -> correct)
 # Sorted by length (longest first) to avoid partial replacements
 OCR_FIXES = [
@@ -120,40 +142,117 @@ OCR_FIXES = [
     ('spint', 'spirit'),
 ]
 
-def fix_ocr_text(text: str) -> tuple[str, int]:
-    """Fix OCR errors in text. Returns (fixed_text, num_fixes)."""
-    total_fixes = 0
+# One case-insensitive alternation over the lowercased fixes; the replacement
+# copies the casing of the matched word (lower, Capitalized or UPPER).
+# Longer keys come first so e.g. 'dehght' wins over 'hght' at the same spot.
+# Case folding is ASCII-only, like the numba scanner below, so e.g. a dotless
+# 'ı' never stands in for 'i'.
+OCR_LOOKUP = {}
+for _wrong, _right in OCR_FIXES:
+    OCR_LOOKUP.setdefault(_wrong.lower(), _right.lower())
+
+OCR_KEYS = sorted(OCR_LOOKUP, key=len, reverse=True)
+OCR_RE = re.compile('|'.join(map(re.escape, OCR_KEYS)), re.IGNORECASE | re.ASCII)
+OCR_BYTES_RE = re.compile(OCR_RE.pattern.encode('ascii'), re.IGNORECASE)
+
+# The same keys as a byte table for the numba scanner: row k is OCR_KEYS[k]
+# zero-padded, and OCR_FIRST_BYTES marks the bytes a key can start with
+OCR_NEEDLES = np.zeros((len(OCR_KEYS), max(map(len, OCR_KEYS))), dtype=np.uint8)
+for _k, _key in enumerate(OCR_KEYS):
+    OCR_NEEDLES[_k, :len(_key)] = np.frombuffer(_key.encode('ascii'), dtype=np.uint8)
+OCR_NEEDLE_LENS = np.array([len(key) for key in OCR_KEYS], dtype=np.int64)
+OCR_FIRST_BYTES = np.zeros(256, dtype=np.bool_)
+OCR_FIRST_BYTES[OCR_NEEDLES[:, 0]] = True
+
+
+def _cased(wrong: str) -> str:
+    right = OCR_LOOKUP[wrong.lower()]
+    if wrong.isupper():
+        return right.upper()
+    if wrong[0].isupper():
+        return right.capitalize()
+    return right
+
+
+def _match_case(match: re.Match) -> str:
+    return _cased(match.group())
+
+
+def _scan(buf, needles, lens, first):
+    """Return (starts, keys) of OCR_RE's matches in a UTF-8 byte buffer."""
+    n = len(buf)
+    starts = np.empty(n, dtype=np.int64)
+    keys = np.empty(n, dtype=np.int64)
+    found = 0
+    i = 0
+    while i < n:
+        c = buf[i]
+        if 65 <= c <= 90:
+            c += 32
+        if first[c]:
+            for k in range(len(lens)):
+                length = lens[k]
+                if i + length > n:
+                    continue
+                j = 0
+                while j < length:
+                    b = buf[i + j]
+                    if 65 <= b <= 90:
+                        b += 32
+                    if b != needles[k, j]:
+                        break
+                    j += 1
+                if j == length:
+                    starts[found] = i
+                    keys[found] = k
+                    found += 1
+                    i += length - 1
+                    break
+        i += 1
+    return starts[:found], keys[:found]
 
-    for wrong, right in OCR_FIXES:
-        # Case-sensitive replacement
-        count = text.count(wrong)
-        if count > 0:
-            text = text.replace(wrong, right)
-            total_fixes += count
 
-        # Also try capitalized version
-        wrong_cap = wrong.capitalize()
-        right_cap = right.capitalize()
-        count = text.count(wrong_cap)
-        if count > 0:
-            text = text.replace(wrong_cap, right_cap)
-            total_fixes += count
+if njit is not None:
+    _scan = njit(cache=True)(_scan)
 
-        # And uppercase
-        wrong_upper = wrong.upper()
-        right_upper = right.upper()
-        count = text.count(wrong_upper)
-        if count > 0:
-            text = text.replace(wrong_upper, right_upper)
-            total_fixes += count
 
-    return text, total_fixes
+def fix_ocr_text(text: str) -> tuple[str, int]:
+    """Fix OCR errors in text. Returns (fixed_text, num_fixes)."""
+    if njit is None:
+        return OCR_RE.subn(_match_case, text)
+
+    # Keys are ASCII, so matches can be spliced on the encoded bytes
+    raw = text.encode()
+    starts, keys = _scan(np.frombuffer(raw, dtype=np.uint8), OCR_NEEDLES, OCR_NEEDLE_LENS, OCR_FIRST_BYTES)
+    if not len(starts):
+        return text, 0
+    parts = []
+    prev = 0
+    for start, k in zip(starts.tolist(), keys.tolist()):
+        end = start + len(OCR_KEYS[k])
+        parts.append(raw[prev:start])
+        parts.append(_cased(raw[start:end].decode()).encode())
+        prev = end
+    parts.append(raw[prev:])
+    return b''.join(parts).decode(), len(starts)
+
+
+def has_ocr_errors(raw: bytes) -> bool:
+    """Screen a whole file's bytes for any OCR error.
+
+    Keys are plain letters, which JSON never escapes, so a clean file can't
+    hide a match; a hit outside an aphorism text just means a full pass.
+    """
+    if njit is None:
+        return OCR_BYTES_RE.search(raw) is not None
+    starts, _ = _scan(np.frombuffer(raw, dtype=np.uint8), OCR_NEEDLES, OCR_NEEDLE_LENS, OCR_FIRST_BYTES)
+    return len(starts) > 0
 
 
 def fix_corpus_file(filepath: Path, dry_run: bool = False) -> dict:
     """Fix OCR errors in a corpus JSON file."""
-    with open(filepath) as f:
-        data = json.load(f)
+    raw = filepath.read_bytes()
+    data = _loads(raw)
 
     stats = {
         'file': filepath.name,
@@ -163,6 +262,10 @@ def fix_corpus_file(filepath: Path, dry_run: bool = False) -> dict:
         'examples': []
     }
 
+    # Most files are already clean; skip the per-aphorism pass for those
+    if not has_ocr_errors(raw):
+        return stats
+
     for aph in data['aphorisms']:
         original = aph['text']
         fixed, num_fixes = fix_ocr_text(original)
@@ -172,27 +275,23 @@ def fix_corpus_file(filepath: Path, dry_run: bool = False) -> dict:
             stats['total_fixes'] += num_fixes
 
             if len(stats['examples']) < 3:
-                # Find a short example of what was fixed
-                for wrong, right in OCR_FIXES:
-                    if wrong in original:
-                        # Extract context around the error
-                        idx = original.find(wrong)
-                        start = max(0, idx - 20)
-                        end = min(len(original), idx + len(wrong) + 20)
-                        stats['examples'].append({
-                            'aphorism': aph['number'],
-                            'wrong': wrong,
-                            'right': right,
-                            'context': f'...{original[start:end]}...'
-                        })
-                        break
+                # The first error in the text serves as a short example
+                match = OCR_RE.search(original)
+                start = max(0, match.start() - 20)
+                end = min(len(original), match.end() + 20)
+                stats['examples'].append({
+                    'aphorism': aph['number'],
+                    'wrong': match.group(),
+                    'right': _match_case(match),
+                    'context': f'...{original[start:end]}...'
+                })
 
             if not dry_run:
                 aph['text'] = fixed
 
     if not dry_run and stats['total_fixes'] > 0:
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(data))
 
     return stats
 
@@ -208,8 +307,11 @@ def main():
     total_aphorisms = 0
     total_fixes = 0
 
-    for filepath in sorted(corpus_dir.glob('*.json')):
-        stats = fix_corpus_file(filepath, dry_run=False)
+    # Files are independent, so fix them in parallel and report in order
+    with ProcessPoolExecutor() as executor:
+        all_stats = list(executor.map(fix_corpus_file, sorted(corpus_dir.glob('*.json'))))
+
+    for stats in all_stats:
         total_files += 1
         total_aphorisms += stats['aphorisms_fixed']
         total_fixes += stats['total_fixes']
@@ -4,17 +4,45 @@ Full corpus LLM-as-Judge analysis for Nietzsche translations.
 Evaluates all 231 aphorisms across 5 English translations + German original.
 """
 
+import asyncio
+import hashlib
 import json
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
+
+try:
+    import orjson
+
+    def _loads(b):
+        return orjson.loads(b)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumpline(obj):
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+    def _dumpline(obj):
+        return json.dumps(obj, ensure_ascii=False).encode() + b'\n'
 
 # Configuration
 CORPUS_DIR = Path('corpus/aligned')
 OUTPUT_DIR = Path('llm_judge/full_analysis')
-CHECKPOINT_FILE = OUTPUT_DIR / 'checkpoint.json'
+CHECKPOINT_FILE = OUTPUT_DIR / 'checkpoint.jsonl'  # One result per line, appended as they arrive
+LEGACY_CHECKPOINT_FILE = OUTPUT_DIR / 'checkpoint.json'  # {"completed": [...], "results": [...]}
+CACHE_FILE = OUTPUT_DIR / 'analysis_cache.json'
 BATCH_SIZE = 10
+MAX_CONCURRENT = 8  # In-flight API requests
+
+# English translators, in the order they appear in the prompt
+CANONICAL_ORDER = ('Walter Kaufman', 'RJ Hollingdale', 'Helen Zimmern', 'Marion Faber', 'Judith Norman')
 MODEL = "claude-sonnet-4-20250514"  # Use Sonnet for cost efficiency
 
 # Evaluation prompt template
@@ -61,26 +89,31 @@ Return ONLY valid JSON (no markdown, no explanation outside JSON):
 }}"""
 
 
+# Successful analyses from this and earlier runs, keyed by prompt hash
+_cache = {}
+
+
+def load_translation(path):
+    """Load one translation as (name, {number: text})."""
+    data = _loads(path.read_bytes())
+    return data['name'], {a['number']: a['text'] for a in data['aphorisms']}
+
+
 def load_corpus():
     """Load all translations."""
-    corpus = {}
-    for path in CORPUS_DIR.glob('*.json'):
-        with open(path) as f:
-            data = json.load(f)
-            corpus[data['name']] = {a['number']: a['text'] for a in data['aphorisms']}
-    return corpus
+    with ThreadPoolExecutor() as executor:
+        return dict(executor.map(load_translation, CORPUS_DIR.glob('*.json')))
 
 
 def get_common_aphorisms(corpus):
     """Find aphorisms present in all translations."""
-    all_nums = [set(t.keys()) for t in corpus.values()]
-    return sorted(set.intersection(*all_nums))
+    return sorted(set.intersection(*map(set, corpus.values())))
 
 
 def format_translations(corpus, aph_num):
     """Format translations for the prompt."""
     lines = []
-    for name in ['Walter Kaufman', 'RJ Hollingdale', 'Helen Zimmern', 'Marion Faber', 'Judith Norman']:
+    for name in CANONICAL_ORDER:
         text = corpus.get(name, {}).get(aph_num, '')
         if text:
             # Truncate very long texts
@@ -90,7 +123,12 @@ def format_translations(corpus, aph_num):
     return "\n".join(lines)
 
 
-def analyze_aphorism(client, corpus, aph_num):
+def format_all_translations(corpus, aphorisms):
+    """Format the prompt translations for every aphorism up front."""
+    return {aph_num: format_translations(corpus, aph_num) for aph_num in aphorisms}
+
+
+async def analyze_aphorism(client, corpus, aph_num, translations):
     """Analyze a single aphorism using Claude."""
     german = corpus.get('Gutenberg', {}).get(aph_num, '')
     if not german:
@@ -100,16 +138,19 @@ def analyze_aphorism(client, corpus, aph_num):
     if len(german) > 1500:
         german = german[:1500] + "... [truncated]"
 
-    translations = format_translations(corpus, aph_num)
-
     prompt = EVAL_PROMPT.format(
         german=german,
         translations=translations,
         aphorism_num=aph_num
     )
 
+    # Identical prompts (same texts, same model) reuse the earlier analysis
+    key = hashlib.sha256(f"{MODEL}\n{prompt}".encode()).hexdigest()
+    if key in _cache:
+        return _cache[key]
+
     try:
-        response = client.messages.create(
+        response = await client.messages.create(
             model=MODEL,
             max_tokens=1500,
             messages=[{"role": "user", "content": prompt}]
@@ -127,6 +168,7 @@ def analyze_aphorism(client, corpus, aph_num):
 
         result = json.loads(text.strip())
         result['aphorism'] = aph_num  # Ensure correct aphorism number
+        _cache[key] = result
         return result
 
     except json.JSONDecodeError as e:
@@ -138,21 +180,44 @@ def analyze_aphorism(client, corpus, aph_num):
 
 
 def load_checkpoint():
-    """Load progress checkpoint."""
+    """
+    Load progress checkpoint as {aphorism: result}; later lines win.
+    Results from a legacy checkpoint.json are read first, so runs started
+    before the switch to the append-only log resume where they stopped.
+    """
+    checkpoint = {}
+    if LEGACY_CHECKPOINT_FILE.exists():
+        for result in _loads(LEGACY_CHECKPOINT_FILE.read_bytes()).get('results', []):
+            checkpoint[result['aphorism']] = result
     if CHECKPOINT_FILE.exists():
-        with open(CHECKPOINT_FILE) as f:
-            return json.load(f)
-    return {"completed": [], "results": []}
+        for line in CHECKPOINT_FILE.read_bytes().splitlines():
+            if line.strip():
+                result = _loads(line)
+                checkpoint[result['aphorism']] = result
+    return checkpoint
+
+
+def load_cache():
+    """Load cached analyses, keyed by prompt hash."""
+    if CACHE_FILE.exists():
+        return _loads(CACHE_FILE.read_bytes())
+    return {}
 
 
-def save_checkpoint(checkpoint):
-    """Save progress checkpoint."""
+def save_cache():
+    """Save cached analyses."""
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    with open(CHECKPOINT_FILE, 'w') as f:
-        json.dump(checkpoint, f, indent=2)
+    with open(CACHE_FILE, 'wb') as f:
+        f.write(_dumps(_cache))
 
 
-def main():
+def append_checkpoint(log, result):
+    """Append one result to the checkpoint log."""
+    log.write(_dumpline(result))
+    log.flush()
+
+
+async def main():
     # Check for API key
     api_key = os.environ.get('ANTHROPIC_API_KEY')
     if not api_key:
@@ -160,7 +225,7 @@ def main():
         print("Run: export ANTHROPIC_API_KEY='your-key-here'")
         return
 
-    client = Anthropic(api_key=api_key)
+    client = AsyncAnthropic(api_key=api_key)
 
     # Load corpus
     print("Loading corpus...")
@@ -168,10 +233,11 @@ def main():
     aphorisms = get_common_aphorisms(corpus)
     print(f"Found {len(aphorisms)} common aphorisms")
 
-    # Load checkpoint
+    # Load checkpoint and analysis cache
     checkpoint = load_checkpoint()
-    completed = set(checkpoint['completed'])
-    results = checkpoint['results']
+    _cache.update(load_cache())
+    # Failed analyses stay in the log but are retried
+    completed = {num for num, result in checkpoint.items() if 'error' not in result}
 
     # Filter to remaining aphorisms
     remaining = [a for a in aphorisms if a not in completed]
@@ -181,44 +247,50 @@ def main():
         print("All aphorisms already analyzed!")
         return
 
-    # Process in batches
-    total_cost = 0
-    for i, aph_num in enumerate(remaining):
-        print(f"[{i+1}/{len(remaining)}] Analyzing §{aph_num}...", end=" ")
-
-        result = analyze_aphorism(client, corpus, aph_num)
+    translations = format_all_translations(corpus, remaining)
 
-        if result:
-            results.append(result)
-            completed.add(aph_num)
+    # Keep up to MAX_CONCURRENT requests in flight, handling results as they finish
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
 
-            if 'error' in result:
-                print(f"ERROR: {result['error']}")
-            else:
-                ranking = result.get('ranking', [])
-                print(f"OK - Top: {ranking[0] if ranking else 'N/A'}")
+    async def analyze(aph_num):
+        async with semaphore:
+            return aph_num, await analyze_aphorism(client, corpus, aph_num, translations[aph_num])
 
-        # Save checkpoint every BATCH_SIZE aphorisms
-        if (i + 1) % BATCH_SIZE == 0:
-            checkpoint = {"completed": list(completed), "results": results}
-            save_checkpoint(checkpoint)
-            print(f"  [Checkpoint saved: {len(completed)} completed]")
-
-        # Rate limiting
-        time.sleep(0.5)
+    tasks = [asyncio.create_task(analyze(aph_num)) for aph_num in remaining]
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with open(CHECKPOINT_FILE, 'ab') as log:
+        for i, task in enumerate(asyncio.as_completed(tasks)):
+            aph_num, result = await task
+            print(f"[{i+1}/{len(remaining)}] Analyzed §{aph_num}...", end=" ")
+
+            if result:
+                checkpoint[aph_num] = result
+                append_checkpoint(log, result)
+
+                if 'error' in result:
+                    print(f"ERROR: {result['error']}")
+                else:
+                    completed.add(aph_num)
+                    ranking = result.get('ranking', [])
+                    print(f"OK - Top: {ranking[0] if ranking else 'N/A'}")
+
+            # Save the analysis cache every BATCH_SIZE aphorisms
+            if (i + 1) % BATCH_SIZE == 0:
+                save_cache()
+                print(f"  [Cache saved: {len(completed)} completed]")
 
     # Final save
-    checkpoint = {"completed": list(completed), "results": results}
-    save_checkpoint(checkpoint)
+    save_cache()
+    results = list(checkpoint.values())
 
     # Save final results
     final_output = OUTPUT_DIR / 'all_analyses.json'
-    with open(final_output, 'w') as f:
-        json.dump({
+    with open(final_output, 'wb') as f:
+        f.write(_dumps({
             "total_analyzed": len(results),
             "model": MODEL,
             "analyses": sorted(results, key=lambda x: x.get('aphorism', 0))
-        }, f, indent=2)
+        }))
 
     print(f"\n{'='*60}")
     print(f"COMPLETE: Analyzed {len(results)} aphorisms")
@@ -227,4 +299,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
@@ -1,23 +1,50 @@
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+
+    def _loads(b):
+        return orjson.loads(b)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
 
 # Load combined file
-with open("llm_judge/combined_1_50.json") as fp:
-    data = json.load(fp)
+data = _loads(Path("llm_judge/combined_1_50.json").read_bytes())
+
+
+def write_json(item):
+    path, obj, message = item
+    with open(path, "wb") as fp:
+        fp.write(_dumps(obj))
+    return message
+
 
 # Split into individual files
 os.makedirs("llm_judge/aphorisms", exist_ok=True)
 
+writes = []  # (path, obj, message), written concurrently below
+
 for aph in data["aphorisms"]:
     num = aph["number"]
-    with open(f"llm_judge/aphorisms/aph_{num:02d}.json", "w") as fp:
-        json.dump(aph, fp, indent=2, ensure_ascii=False)
-    print(f"Saved aphorism {num}")
+    writes.append((f"llm_judge/aphorisms/aph_{num:02d}.json", aph, f"Saved aphorism {num}"))
 
 # Also create batches of 5 for easier reading
 for batch_start in range(1, 51, 5):
     batch_end = min(batch_start + 4, 50)
     batch_aphs = [a for a in data["aphorisms"] if batch_start <= a["number"] <= batch_end]
-    with open(f"llm_judge/aphorisms/batch_{batch_start:02d}_{batch_end:02d}.json", "w") as fp:
-        json.dump({"aphorisms": batch_aphs}, fp, indent=2, ensure_ascii=False)
-    print(f"Saved batch {batch_start}-{batch_end}")
+    writes.append((f"llm_judge/aphorisms/batch_{batch_start:02d}_{batch_end:02d}.json",
+                   {"aphorisms": batch_aphs}, f"Saved batch {batch_start}-{batch_end}"))
+
+# The files are tiny and independent, so overlap their open/write/close
+with ThreadPoolExecutor(max_workers=16) as executor:
+    for message in executor.map(write_json, writes):
+        print(message)
@@ -30,21 +30,41 @@ from domain_adaptation import (
 )
 from embed import Embedder, load_aligned_corpus, align_aphorisms
 
+try:
+    import orjson
+
+    def _loads(b):
+        return orjson.loads(b)
+except ImportError:
+    _loads = json.loads
+
 
 def load_embeddings(embedding_dir: str) -> dict:
-    """Load all saved embeddings."""
+    """
+    Load all saved embeddings.
+
+    Reads each .npy file and every array bundled in a .npz archive (as
+    written by save_calibrated). .npy arrays are memory-mapped read-only,
+    so only the set being processed is paged in; callers that modify them
+    must work on a copy. float16 files (as written by embed.py) are
+    upcast to float32 in memory.
+    """
     emb_dir = Path(embedding_dir)
     embeddings = {}
 
     for npy_file in emb_dir.glob("*.npy"):
         name = npy_file.stem.replace("_", " ").title()
-        embeddings[name] = np.load(npy_file)
+        embeddings[name] = np.load(npy_file, mmap_mode="r").astype(np.float32, copy=False)
+
+    for npz_file in emb_dir.glob("*.npz"):
+        with np.load(npz_file) as bundle:
+            for key in bundle.files:
+                embeddings[key.replace("_", " ").title()] = bundle[key]
 
     # Load index
     index_path = emb_dir / "index.json"
     if index_path.exists():
-        with open(index_path) as f:
-            index = json.load(f)
+        index = _loads(index_path.read_bytes())
     else:
         index = None
 
@@ -95,19 +115,25 @@ def calibrate_all(embeddings: dict, methods: list = None) -> dict:
     for name, emb in embeddings.items():
         print(f"\nCalibrating {name}...")
 
-        result = emb.copy()
+        # No copy needed: every method returns a new array
+        result = emb
+        before_iso = None
 
-        for method in methods:
+        for i, method in enumerate(methods):
             if method == "whiten":
                 print("  Applying whitening...")
-                result = calibrator.whiten(result)
+                result, svals = calibrator.whiten(result, return_singular_values=True)
+                if i == 0:
+                    # Whitening decomposed the untouched input; reuse that
+                    before_iso = calibrator.isotropy_from_singular_values(svals)
 
             elif method == "remove_pc":
                 print("  Removing top principal component...")
                 result = calibrator.remove_principal_components(result, n_components=1)
 
         # Show improvement
-        before_iso = calibrator.isotropy_score(emb)
+        if before_iso is None:
+            before_iso = calibrator.isotropy_score(emb)
         after_iso = calibrator.isotropy_score(result)
         print(f"  Isotropy: {before_iso:.4f} -> {after_iso:.4f}")
 
@@ -117,14 +143,21 @@ def calibrate_all(embeddings: dict, methods: list = None) -> dict:
 
 
 def save_calibrated(calibrated: dict, output_dir: str, suffix: str = "_calibrated"):
-    """Save calibrated embeddings."""
+    """
+    Save calibrated embeddings as one .npz archive.
+
+    Each array is stored under the stem its own .npy file would have had
+    (e.g. "gutenberg_calibrated"), so load_embeddings names them the same.
+    """
     out_dir = Path(output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    for name, emb in calibrated.items():
-        filename = name.lower().replace(" ", "_") + suffix + ".npy"
-        np.save(out_dir / filename, emb)
-        print(f"Saved: {out_dir / filename}")
+    path = out_dir / (suffix.strip("_") + ".npz")
+    np.savez(path, **{
+        name.lower().replace(" ", "_") + suffix: emb
+        for name, emb in calibrated.items()
+    })
+    print(f"Saved: {path} ({len(calibrated)} embedding sets)")
 
 
 def find_translation_outliers(embeddings: dict, german_key: str = None, top_n: int = 10):
@@ -151,23 +184,31 @@ def find_translation_outliers(embeddings: dict, german_key: str = None, top_n: i
 
     anchor = ContrastiveAnchor(german_emb, translation_embs)
 
-    # Find outliers
-    outliers = []
-    for idx in range(len(german_emb)):
-        triangulation = anchor.triangulate_meaning(idx)
-        similarities = list(triangulation.values())
-        spread = max(similarities) - min(similarities)
-        outliers.append((idx, spread, triangulation))
+    # Find outliers: spread of centroid similarities across translators,
+    # for all aphorisms at once
+    names, similarities = anchor.triangulate_all()
+    spreads = similarities.max(axis=0) - similarities.min(axis=0)
+    order = np.arange(len(spreads))
+    if top_n < len(spreads):
+        order = np.argpartition(-spreads, top_n)[:top_n]
+    order = order[np.argsort(-spreads[order], kind="stable")]
 
-    outliers.sort(key=lambda x: -x[1])
+    # Report straight from the (translators, aphorisms) array
+    top = similarities[:, order]
+    ranked = np.argsort(-top, axis=0, kind="stable")
 
     print(f"\nTop {top_n} passages with most translation disagreement:")
-    for idx, spread, tri in outliers[:top_n]:
-        print(f"\n  Aphorism index {idx} (spread: {spread:.4f}):")
-        for trans, sim in sorted(tri.items(), key=lambda x: -x[1]):
-            print(f"    {trans}: {sim:.4f}")
+    for col, idx in enumerate(order):
+        print(f"\n  Aphorism index {idx} (spread: {spreads[idx]:.4f}):")
+        for t in ranked[:, col]:
+            print(f"    {names[t]}: {top[t, col]:.4f}")
 
-    return outliers[:top_n]
+    # Per-translator breakdowns are only built for the returned passages
+    return [
+        (int(idx), float(spreads[idx]),
+         {name: float(sim) for name, sim in zip(names, top[:, col])})
+        for col, idx in enumerate(order)
+    ]
 
 
 def generate_calibrated_embeddings(corpus_dir: str = "corpus/aligned",
@@ -198,6 +239,9 @@ def generate_calibrated_embeddings(corpus_dir: str = "corpus/aligned",
     embeddings = {}
     calibrated = {}
 
+    # Prompt every translator's texts into one batch so the encoder runs once
+    all_texts = []
+    offsets = {}
     for name in corpus.keys():
         texts = [aligned[n].get(name, "") for n in aphorism_nums]
         texts = [t if t else "[MISSING]" for t in texts]
@@ -207,23 +251,22 @@ def generate_calibrated_embeddings(corpus_dir: str = "corpus/aligned",
         language = "german" if is_german else "english"
 
         # Apply prompting
-        prompted_texts = [
-            prompter.apply_prompt(t, style="context_prefix", language=language)
-            for t in texts
-        ]
+        start = len(all_texts)
+        all_texts.extend(
+            prompter.apply_prompts(texts, style="context_prefix", language=language)
+        )
+        offsets[name] = (start, len(all_texts))
 
-        print(f"\nEmbedding {name}...")
-        raw_emb = embedder.embed(prompted_texts)
+    print(f"\nEmbedding {len(all_texts)} texts from {len(offsets)} translations...")
+    all_emb = embedder.embed(all_texts, batch_size=64)
+
+    for name, (start, end) in offsets.items():
+        raw_emb = all_emb[start:end]
         embeddings[name] = raw_emb
 
-        # Calibrate
+        # Calibrate: whiten, then remove the top PC if still anisotropic
         print(f"Calibrating {name}...")
-        cal_emb = calibrator.whiten(raw_emb)
-
-        # Check if we need PC removal
-        diagnosis = diagnose_embedding_quality(cal_emb)
-        if diagnosis['isotropy_score'] < 0.1:
-            cal_emb = calibrator.remove_principal_components(cal_emb, 1)
+        cal_emb = calibrator.calibrate_pipeline(raw_emb, pc_remove=1, isotropy_threshold=0.1)
 
         calibrated[name] = cal_emb
 
@@ -236,10 +279,9 @@ def generate_calibrated_embeddings(corpus_dir: str = "corpus/aligned",
         filename = name.lower().replace(" ", "_") + ".npy"
         np.save(out_dir / filename, emb)
 
-    # Save calibrated embeddings
-    for name, emb in calibrated.items():
-        filename = name.lower().replace(" ", "_") + "_calibrated.npy"
-        np.save(out_dir / filename, emb)
+    # Save calibrated embeddings (raw ones stay as per-translator .npy
+    # files, which generate_explorer_data reads directly)
+    save_calibrated(calibrated, out_dir)
 
     # Save index
     with open(out_dir / "index.json", "w") as f:
@@ -251,7 +293,7 @@ def generate_calibrated_embeddings(corpus_dir: str = "corpus/aligned",
 
     print(f"\nSaved to {out_dir}")
     print("  - Raw embeddings: *.npy")
-    print("  - Calibrated embeddings: *_calibrated.npy")
+    print("  - Calibrated embeddings: calibrated.npz")
 
 
 def main():
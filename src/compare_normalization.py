@@ -3,22 +3,33 @@ Compare embeddings before/after archaic German normalization.
 Measures the impact of orthography normalization on cross-lingual similarity.
 """
 
+import hashlib
 import json
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from sentence_transformers import SentenceTransformer
 
+import normalize
 from normalize import normalize_text
 
+try:
+    import orjson
+
+    def _loads(b):
+        return orjson.loads(b)
+except ImportError:
+    _loads = json.loads
+
+NORMALIZE_CACHE = Path('outputs/normalize_cache.json')
+
 
 def load_corpus():
     """Load all translations."""
-    corpus = {}
-    for path in Path('corpus/aligned').glob('*.json'):
-        with open(path) as f:
-            data = json.load(f)
-            corpus[data['name']] = data
-    return corpus
+    paths = list(Path('corpus/aligned').glob('*.json'))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        translations = executor.map(lambda path: _loads(path.read_bytes()), paths)
+    return {data['name']: data for data in translations}
 
 
 def get_aligned_texts(corpus, numbers):
@@ -32,9 +43,39 @@ def get_aligned_texts(corpus, numbers):
     return aligned
 
 
+def normalize_cached(texts):
+    """
+    normalize_text over texts, reusing results saved by earlier runs.
+
+    Results are keyed on a blake2b hash of each text; the cache is dropped
+    whenever normalize.py changes, since its output would too.
+    """
+    version = hashlib.blake2b(Path(normalize.__file__).read_bytes(), digest_size=16).hexdigest()
+    cache = {}
+    if NORMALIZE_CACHE.exists():
+        saved = _loads(NORMALIZE_CACHE.read_bytes())
+        if saved.get('normalizer') == version:
+            cache = saved['texts']
+
+    normalized = []
+    misses = 0
+    for text in texts:
+        key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        if key not in cache:
+            cache[key] = normalize_text(text)
+            misses += 1
+        normalized.append(cache[key])
+
+    if misses:
+        NORMALIZE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(NORMALIZE_CACHE, 'w') as f:
+            json.dump({'normalizer': version, 'texts': cache}, f, ensure_ascii=False)
+    return normalized
+
+
 def cosine_sim(a, b):
-    """Cosine similarity for normalized vectors."""
-    return np.dot(a, b)
+    """Cosine similarity for normalized vectors, row by row for matrices."""
+    return np.einsum('...i,...i->...', a, b)
 
 
 def run_comparison():
@@ -51,7 +92,7 @@ def run_comparison():
 
     # Prepare German texts (original and normalized)
     german_original = [aligned['Gutenberg'][n] for n in common]
-    german_normalized = [normalize_text(t) for t in german_original]
+    german_normalized = normalize_cached(german_original)
 
     # Pick one English translation for comparison (Hollingdale was closest)
     english = [aligned['RJ Hollingdale'][n] for n in common]
@@ -60,20 +101,18 @@ def run_comparison():
     print("Loading model...")
     model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
 
-    # Embed all three
-    print("Embedding original German...")
-    emb_original = model.encode(german_original, normalize_embeddings=True, show_progress_bar=True)
-
-    print("Embedding normalized German...")
-    emb_normalized = model.encode(german_normalized, normalize_embeddings=True, show_progress_bar=True)
-
-    print("Embedding English (Hollingdale)...")
-    emb_english = model.encode(english, normalize_embeddings=True, show_progress_bar=True)
+    # Embed all three in one batch, then split back out
+    print("Embedding original German, normalized German and English (Hollingdale)...")
+    n = len(common)
+    all_emb = model.encode(german_original + german_normalized + english,
+                           batch_size=64, normalize_embeddings=True, show_progress_bar=True)
+    emb_original, emb_normalized, emb_english = all_emb[:n], all_emb[n:2 * n], all_emb[2 * n:]
 
     # Compute similarities
-    sim_orig_en = [cosine_sim(emb_original[i], emb_english[i]) for i in range(len(common))]
-    sim_norm_en = [cosine_sim(emb_normalized[i], emb_english[i]) for i in range(len(common))]
-    sim_orig_norm = [cosine_sim(emb_original[i], emb_normalized[i]) for i in range(len(common))]
+    sim_orig_en = cosine_sim(emb_original, emb_english)
+    sim_norm_en = cosine_sim(emb_normalized, emb_english)
+    sim_orig_norm = cosine_sim(emb_original, emb_normalized)
+    improvement = sim_norm_en - sim_orig_en
 
     # Results
     print("\n" + "=" * 60)
@@ -88,8 +127,8 @@ def run_comparison():
     print("(1.0 = identical, lower = more changes)")
 
     # Find aphorisms with biggest improvement
-    improvements = [(common[i], sim_norm_en[i] - sim_orig_en[i]) for i in range(len(common))]
-    improvements.sort(key=lambda x: -x[1])
+    order = np.argsort(-improvement, kind='stable')
+    improvements = [(common[i], improvement[i]) for i in order]
 
     print("\nTop 5 aphorisms with biggest improvement:")
     for num, imp in improvements[:5]:
@@ -109,7 +148,7 @@ def run_comparison():
                 'number': common[i],
                 'original_sim': float(sim_orig_en[i]),
                 'normalized_sim': float(sim_norm_en[i]),
-                'improvement': float(sim_norm_en[i] - sim_orig_en[i])
+                'improvement': float(improvement[i])
             }
             for i in range(len(common))
         ]
@@ -23,7 +23,10 @@ References:
 - Arora et al. (2017) "A Simple but Tough-to-Beat Baseline for Sentence Embeddings"
 """
 
+import re
 import numpy as np
+from scipy.linalg import orthogonal_procrustes
+from scipy.sparse.linalg import svds
 from typing import Dict, List, Tuple, Optional, Callable
 from dataclasses import dataclass
 from collections import defaultdict
@@ -31,6 +34,15 @@ import json
 from pathlib import Path
 
 
+def _coerce(x) -> np.ndarray:
+    """
+    Embeddings as a C-contiguous float32 array, without copying if they
+    already are one. Sliced or float64 inputs would otherwise make BLAS
+    matmuls copy them on every call.
+    """
+    return np.ascontiguousarray(x, dtype=np.float32)
+
+
 # =============================================================================
 # 1. PROMPT ENGINEERING FOR EMBEDDINGS
 # =============================================================================
@@ -90,22 +102,33 @@ class PhilosophicalPromptEngineer:
         ]
     }
 
+    # Case-insensitive patterns for the English markers, compiled once:
+    # (lowercased term, pattern, marked replacement)
+    _ENGLISH_MARKER_PATTERNS = [
+        (term.lower(), re.compile(re.escape(term), re.IGNORECASE), f"[{term}]")
+        for term in PHILOSOPHICAL_MARKERS["english"]
+    ]
+
+    # Keywords signalling each major concept, checked in priority order
+    CONCEPT_KEYWORDS = (
+        ("will_to_power", ("will to power", "wille zur macht", "power", "macht")),
+        ("eternal_return", ("eternal", "recurrence", "return", "wiederkunft", "wiederkehr")),
+        ("ubermensch", ("übermensch", "overman", "superman", "higher man")),
+        ("nihilism", ("nihil", "nothing", "value", "meaning", "worthless")),
+        ("ressentiment", ("ressentiment", "slave", "revenge", "weak", "herd")),
+    )
+
     @classmethod
     def detect_concept(cls, text: str) -> Optional[str]:
         """Detect which major concept a passage discusses."""
         text_lower = text.lower()
 
-        concept_keywords = {
-            "will_to_power": ["will to power", "wille zur macht", "power", "macht"],
-            "eternal_return": ["eternal", "recurrence", "return", "wiederkunft", "wiederkehr"],
-            "ubermensch": ["übermensch", "overman", "superman", "higher man"],
-            "nihilism": ["nihil", "nothing", "value", "meaning", "worthless"],
-            "ressentiment": ["ressentiment", "slave", "revenge", "weak", "herd"],
-        }
-
-        for concept, keywords in concept_keywords.items():
-            if any(kw in text_lower for kw in keywords):
-                return concept
+        # Plain substring tests run in C; on the corpus they beat a
+        # compiled keyword alternation, which must also keep the priority
+        for concept, keywords in cls.CONCEPT_KEYWORDS:
+            for kw in keywords:
+                if kw in text_lower:
+                    return concept
         return None
 
     @classmethod
@@ -131,6 +154,29 @@ class PhilosophicalPromptEngineer:
 
         return prompts.get("english", "{text}").format(text=text)
 
+    @classmethod
+    def apply_prompts(cls, texts: List[str], style: str = "context_prefix",
+                      language: str = "english") -> List[str]:
+        """
+        apply_prompt over a batch of texts, resolving the template once.
+        """
+        prompts = cls.PROMPTS.get(style, cls.PROMPTS["context_prefix"])
+        if language in prompts:
+            template = prompts[language]
+        else:
+            template = prompts.get("english", "{text}")
+
+        if style != "concept_focused":
+            return [template.format(text=text) for text in texts]
+
+        prompted = []
+        for text in texts:
+            concept = cls.detect_concept(text)
+            prompted.append(
+                (prompts[concept] if concept in prompts else template).format(text=text)
+            )
+        return prompted
+
     @classmethod
     def preserve_terms(cls, text: str) -> str:
         """
@@ -141,12 +187,14 @@ class PhilosophicalPromptEngineer:
         for term in cls.PHILOSOPHICAL_MARKERS["german"]:
             if term in text:
                 text = text.replace(term, f"[{term}]")
-        for term in cls.PHILOSOPHICAL_MARKERS["english"]:
-            if term.lower() in text.lower():
+        # Terms are replaced one after another, each seeing the previous
+        # markers, so this stays a sequence of subs rather than one pattern
+        text_lower = text.lower()
+        for term_lower, pattern, marked in cls._ENGLISH_MARKER_PATTERNS:
+            if term_lower in text_lower:
                 # Case-insensitive replacement with markers
-                import re
-                pattern = re.compile(re.escape(term), re.IGNORECASE)
-                text = pattern.sub(f"[{term}]", text)
+                text = pattern.sub(marked, text)
+                text_lower = text.lower()
         return text
 
 
@@ -166,7 +214,8 @@ class EmbeddingCalibrator:
     """
 
     @staticmethod
-    def whiten(embeddings: np.ndarray, eps: float = 1e-6) -> np.ndarray:
+    def whiten(embeddings: np.ndarray, eps: float = 1e-6,
+               return_singular_values: bool = False):
         """
         Whitening transformation to make embedding space isotropic.
 
@@ -182,32 +231,43 @@ class EmbeddingCalibrator:
         Args:
             embeddings: (n, d) array of embeddings
             eps: Small constant for numerical stability
+            return_singular_values: Also return the singular values of the
+                scaled, centered input, from which the input's isotropy can
+                be read without another decomposition
 
         Returns:
-            Whitened embeddings with same shape
+            Whitened embeddings with same shape, and the singular values if
+            return_singular_values is set
         """
+        # Single precision is plenty for whitening, and halves the memory
+        # traffic of the SVD and matmuls (float64 inputs are downcast)
+        embeddings = _coerce(embeddings)
+
         # Center the embeddings
         mean = embeddings.mean(axis=0)
         centered = embeddings - mean
 
-        # Compute covariance matrix
-        cov = np.cov(centered, rowvar=False)
-
-        # Eigendecomposition
-        eigenvalues, eigenvectors = np.linalg.eigh(cov)
+        # SVD of the scaled data instead of eigh of the (d, d) covariance:
+        # cov = V * S^2 * V^T, so S^2 are its eigenvalues. With n < d this is
+        # the cheaper decomposition, and more accurate than forming cov.
+        scale = np.sqrt(len(centered) - 1, dtype=np.float32)
+        scaled = centered / scale
+        _, S, Vt = np.linalg.svd(scaled, full_matrices=False)
 
         # Compute whitening matrix: W = V * D^(-1/2) * V^T
-        # where D is diagonal matrix of eigenvalues, V is eigenvectors
-        D_inv_sqrt = np.diag(1.0 / np.sqrt(eigenvalues + eps))
-        W = eigenvectors @ D_inv_sqrt @ eigenvectors.T
+        # where D = S^2 is the diagonal of eigenvalues, V the eigenvectors;
+        # scaling V's columns by broadcasting avoids building diag(D^(-1/2))
+        W = (Vt.T / np.sqrt(S ** 2 + eps)) @ Vt
 
-        # Apply whitening
-        whitened = centered @ W
+        # Apply whitening, into the scaled copy the SVD no longer needs
+        whitened = np.matmul(centered, W, out=scaled)
 
         # Re-normalize
         norms = np.linalg.norm(whitened, axis=1, keepdims=True)
-        whitened = whitened / (norms + eps)
+        whitened /= norms + eps
 
+        if return_singular_values:
+            return whitened, S
         return whitened
 
     @staticmethod
@@ -239,10 +299,15 @@ class EmbeddingCalibrator:
         source_knn_sim = np.partition(sim_matrix, -k, axis=1)[:, -k:].mean(axis=1)
 
         # For each target point, get mean similarity to k nearest sources
-        target_knn_sim = np.partition(sim_matrix.T, -k, axis=1)[:, -k:].mean(axis=1)
+        # (partitioning down the columns, rather than across a transpose)
+        target_knn_sim = np.partition(sim_matrix, -k, axis=0)[-k:].mean(axis=0)
 
-        # CSLS score: 2 * cos(x,y) - mean_knn(x) - mean_knn(y)
-        csls = 2 * sim_matrix - source_knn_sim[:, np.newaxis] - target_knn_sim[np.newaxis, :]
+        # CSLS score: 2 * cos(x,y) - mean_knn(x) - mean_knn(y),
+        # built in place on the similarity matrix
+        csls = sim_matrix
+        csls *= 2
+        csls -= source_knn_sim[:, np.newaxis]
+        csls -= target_knn_sim[np.newaxis, :]
 
         return csls
 
@@ -264,35 +329,123 @@ class EmbeddingCalibrator:
         Returns:
             Adjusted embeddings
         """
+        embeddings = _coerce(embeddings)
+
         # Center
         mean = embeddings.mean(axis=0)
         centered = embeddings - mean
 
-        # Get top principal components via SVD (more stable than PCA)
-        U, S, Vt = np.linalg.svd(centered, full_matrices=False)
+        if n_components > 0:
+            # Get top principal components via SVD (more stable than PCA).
+            # Only the top few are needed, so solve for just those; svds
+            # requires k < min(n, d), otherwise take them from the full SVD.
+            if n_components < min(centered.shape):
+                _, _, Vt = svds(centered, k=n_components, random_state=0)
+            else:
+                Vt = np.linalg.svd(centered, full_matrices=False)[2]
 
-        # Project out top components
-        for i in range(n_components):
-            pc = Vt[i]  # i-th principal component
-            centered = centered - np.outer(centered @ pc, pc)
+            # Project out top components. They are orthonormal, so removing
+            # them all at once equals removing them one at a time.
+            centered -= (centered @ Vt.T) @ Vt
 
         # Re-normalize
         norms = np.linalg.norm(centered, axis=1, keepdims=True)
-        centered = centered / (norms + 1e-8)
+        centered /= norms + 1e-8
+
+        return centered
+
+    @staticmethod
+    def calibrate_pipeline(embeddings: np.ndarray, whiten: bool = True,
+                           pc_remove: int = 0,
+                           isotropy_threshold: Optional[float] = None) -> np.ndarray:
+        """
+        Whitening followed by principal component removal, in one pass.
+
+        Equivalent to calling whiten() and then remove_principal_components()
+        on its output, except that when isotropy_threshold is given the PCs
+        are only removed if the (whitened) embeddings score below it. The
+        isotropy check and the PC removal share a single centering and SVD.
+        (Whitening re-normalizes, so its own SVD cannot be reused here.)
+
+        Args:
+            embeddings: (n, d) embeddings
+            whiten: Apply whitening first
+            pc_remove: Number of top PCs to remove
+            isotropy_threshold: Only remove PCs if isotropy is below this
+
+        Returns:
+            Calibrated embeddings with same shape
+        """
+        embeddings = _coerce(embeddings)
+        if whiten:
+            embeddings = EmbeddingCalibrator.whiten(embeddings)
+        if pc_remove <= 0:
+            return embeddings
+
+        centered = embeddings - embeddings.mean(axis=0)
+        _, S, Vt = np.linalg.svd(centered, full_matrices=False)
 
+        if isotropy_threshold is not None:
+            isotropy = EmbeddingCalibrator.isotropy_from_singular_values(
+                S / np.sqrt(len(centered) - 1, dtype=np.float32))
+            if isotropy >= isotropy_threshold:
+                return embeddings
+
+        # Project out top components, as in remove_principal_components
+        top = Vt[:pc_remove]
+        centered -= (centered @ top.T) @ top
+
+        # Re-normalize
+        norms = np.linalg.norm(centered, axis=1, keepdims=True)
+        centered /= norms + 1e-8
         return centered
 
     @staticmethod
-    def isotropy_score(embeddings: np.ndarray) -> float:
+    def isotropy_score(embeddings: np.ndarray, exact: bool = True,
+                       n_directions: int = 25, seed: int = 0,
+                       assume_centered: bool = False) -> float:
         """
         Measure how isotropic (uniform) the embedding distribution is.
 
         Returns value between 0 (highly anisotropic) and 1 (perfectly isotropic).
+
+        With exact=False, approximates isotropy from the partition function
+        F(u) = sum_i exp(<e_i, u>) over n_directions random unit vectors u,
+        returning min F / max F (Mu & Viswanath 2018, "All-but-the-Top").
+        This is a single (n, d) x (d, k) product instead of an SVD, but it is
+        a different ratio from the eigenvalue one, so thresholds tuned on
+        the exact score do not carry over.
+
+        With assume_centered=True, the exact score skips re-centering, for
+        callers whose embeddings already have zero mean. Whitened output is
+        re-normalized and so is not centered.
         """
-        # Compute eigenvalues of covariance matrix
-        centered = embeddings - embeddings.mean(axis=0)
-        cov = np.cov(centered, rowvar=False)
-        eigenvalues = np.linalg.eigvalsh(cov)
+        embeddings = _coerce(embeddings)
+
+        if not exact:
+            rng = np.random.default_rng(seed)
+            U = rng.standard_normal((embeddings.shape[1], n_directions), dtype=np.float32)
+            U /= np.linalg.norm(U, axis=0, keepdims=True)
+            F = np.exp(embeddings @ U).sum(axis=0)
+            return float(F.min() / (F.max() + 1e-8))
+
+        # Eigenvalues of the covariance matrix, as squared singular values
+        # of the scaled, centered data
+        if assume_centered:
+            centered = embeddings
+        else:
+            centered = embeddings - embeddings.mean(axis=0)
+        scale = np.sqrt(len(centered) - 1, dtype=np.float32)
+        S = np.linalg.svd(centered / scale, compute_uv=False)
+        return EmbeddingCalibrator.isotropy_from_singular_values(S)
+
+    @staticmethod
+    def isotropy_from_singular_values(S: np.ndarray) -> float:
+        """
+        isotropy_score from the singular values of the scaled, centered data,
+        e.g. as returned by whiten(..., return_singular_values=True).
+        """
+        eigenvalues = S ** 2
 
         # Isotropy = min(eigenvalue) / max(eigenvalue)
         # Perfectly isotropic = 1.0
@@ -320,9 +473,14 @@ class ContrastiveAnchor:
             german_embeddings: (n, d) embeddings of German source texts
             translation_embeddings: {translator_name: (n, d) embeddings}
         """
-        self.german = german_embeddings
-        self.translations = translation_embeddings
-        self.n_aphorisms = german_embeddings.shape[0]
+        # Single precision throughout: float32 inputs are used as is
+        self.german = _coerce(german_embeddings)
+        self.translations = {
+            name: _coerce(emb)
+            for name, emb in translation_embeddings.items()
+        }
+        self.n_aphorisms = self.german.shape[0]
+        self._triangulation = None  # (names, similarities), see precompute_triangulation
 
     def compute_translation_offsets(self) -> Dict[str, np.ndarray]:
         """
@@ -330,12 +488,11 @@ class ContrastiveAnchor:
 
         This captures the "translation direction" in embedding space.
         """
-        offsets = {}
-        for name, trans_emb in self.translations.items():
-            # Average difference: translation - german
-            offset = (trans_emb - self.german).mean(axis=0)
-            offsets[name] = offset
-        return offsets
+        # Average difference: mean(translation - german) is
+        # mean(translation) - mean(german), so no (n, d) difference is built
+        german_mean = self.german.mean(axis=0)
+        return {name: trans_emb.mean(axis=0) - german_mean
+                for name, trans_emb in self.translations.items()}
 
     def align_to_german(self, translation_emb: np.ndarray,
                         offset: np.ndarray) -> np.ndarray:
@@ -344,10 +501,11 @@ class ContrastiveAnchor:
 
         Useful for making cross-lingual comparisons more accurate.
         """
-        aligned = translation_emb - offset
-        # Re-normalize
-        norms = np.linalg.norm(aligned, axis=1, keepdims=True)
-        return aligned / (norms + 1e-8)
+        aligned = _coerce(translation_emb) - _coerce(offset)
+        # Re-normalize in place, with row norms from a single einsum pass
+        norms = np.sqrt(np.einsum('ij,ij->i', aligned, aligned))
+        aligned /= (norms + 1e-8)[:, np.newaxis]
+        return aligned
 
     def compute_procrustes_alignment(self, source: np.ndarray,
                                       target: np.ndarray) -> np.ndarray:
@@ -365,12 +523,12 @@ class ContrastiveAnchor:
         Returns:
             (d, d) rotation matrix W
         """
-        # SVD of cross-covariance matrix
-        M = target.T @ source
-        U, S, Vt = np.linalg.svd(M)
+        source = _coerce(source)
+        target = _coerce(target)
 
-        # Optimal rotation
-        W = Vt.T @ U.T
+        # Optimal rotation from the SVD of the cross-covariance matrix,
+        # W = V @ U^T for target^T @ source = U S V^T
+        W, _ = orthogonal_procrustes(source, target, check_finite=False)
 
         return W
 
@@ -387,8 +545,10 @@ class ContrastiveAnchor:
         for name, trans_emb in self.translations.items():
             expected_pos = self.german + offsets[name]
 
-            # Compute per-aphorism deviation from expected
-            deviations = np.linalg.norm(trans_emb - expected_pos, axis=1)
+            # Compute per-aphorism deviation from expected, with row norms
+            # from one einsum pass over the difference
+            diff = trans_emb - expected_pos
+            deviations = np.sqrt(np.einsum('ij,ij->i', diff, diff))
 
             # Convert to quality score (inverse of deviation)
             # Normalize by mean deviation
@@ -396,7 +556,7 @@ class ContrastiveAnchor:
             quality_scores = 1.0 - (deviations / (mean_dev * 2))
             quality_scores = np.clip(quality_scores, 0, 1)
 
-            quality[name] = {i: float(q) for i, q in enumerate(quality_scores)}
+            quality[name] = dict(enumerate(quality_scores.tolist()))
 
         return quality
 
@@ -409,23 +569,37 @@ class ContrastiveAnchor:
 
         Returns similarity of each translation to the centroid of all translations.
         """
-        # Get all translation embeddings for this aphorism
-        trans_vectors = []
-        trans_names = []
-        for name, emb in self.translations.items():
-            trans_vectors.append(emb[aphorism_idx])
-            trans_names.append(name)
+        # All aphorisms are triangulated together on first use, so repeated
+        # calls are lookups into the stored (n_translators, n_aphorisms) array
+        if self._triangulation is None:
+            self.precompute_triangulation()
+        names, similarities = self._triangulation
+
+        return {name: float(sim) for name, sim in zip(names, similarities[:, aphorism_idx])}
+
+    def precompute_triangulation(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Triangulate every aphorism and store the result for triangulate_meaning.
 
-        trans_vectors = np.array(trans_vectors)
+        Call again if self.translations is changed afterwards.
+        """
+        self._triangulation = self.triangulate_all()
+        return self._triangulation
+
+    def triangulate_all(self) -> Tuple[List[str], np.ndarray]:
+        """
+        triangulate_meaning for every aphorism at once.
 
-        # Compute centroid
-        centroid = trans_vectors.mean(axis=0)
-        centroid = centroid / np.linalg.norm(centroid)
+        Returns translator names and a (n_translators, n_aphorisms) array of
+        each translation's similarity to its aphorism's centroid.
+        """
+        names = list(self.translations)
+        trans_vectors = np.stack([self.translations[name] for name in names])  # (t, n, d)
 
-        # Compute similarity of each translation to centroid
-        similarities = trans_vectors @ centroid
+        centroids = trans_vectors.mean(axis=0)
+        centroids /= np.linalg.norm(centroids, axis=1, keepdims=True)
 
-        return {name: float(sim) for name, sim in zip(trans_names, similarities)}
+        return names, np.einsum('tnd,nd->tn', trans_vectors, centroids)
 
 
 # =============================================================================
@@ -445,8 +619,11 @@ class EmbeddingSurgeon:
 
     def __init__(self, embedding_dim: int):
         self.dim = embedding_dim
-        self.weights = np.ones(embedding_dim)
+        self.weights = np.ones(embedding_dim, dtype=np.float32)
         self.dimension_roles = {}
+        # {(concept, strength): concept_weights}, valid for _focus_roles
+        self._focus_cache: Dict[Tuple[str, float], np.ndarray] = {}
+        self._focus_roles = None
 
     def identify_discriminative_dimensions(self,
                                            group1: np.ndarray,
@@ -520,22 +697,16 @@ class EmbeddingSurgeon:
         """
         weights = np.ones(self.dim)
 
-        for _ in range(iterations):
-            gradient = np.zeros(self.dim)
-
-            # Similar pairs: reward dimensions where values are close
-            for e1, e2 in similar_pairs:
-                diff = np.abs(e1 - e2)
-                gradient -= diff  # Decrease weight on differing dimensions
+        # The gradient does not depend on the weights, so compute it once.
+        # Similar pairs: decrease weight on dimensions where values differ;
+        # dissimilar pairs: increase it
+        gradient = (self._summed_differences(dissimilar_pairs)
+                    - self._summed_differences(similar_pairs))
 
-            # Dissimilar pairs: reward dimensions where values differ
-            for e1, e2 in dissimilar_pairs:
-                diff = np.abs(e1 - e2)
-                gradient += diff  # Increase weight on differing dimensions
-
-            # Normalize gradient
-            gradient = gradient / (np.linalg.norm(gradient) + 1e-8)
+        # Normalize gradient
+        gradient = gradient / (np.linalg.norm(gradient) + 1e-8)
 
+        for _ in range(iterations):
             # Update weights
             weights = weights + learning_rate * gradient
 
@@ -545,15 +716,24 @@ class EmbeddingSurgeon:
             # Normalize
             weights = weights / weights.mean()
 
+        weights = weights.astype(np.float32)
         self.weights = weights
         return weights
 
+    def _summed_differences(self, pairs: List[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+        """Sum of |e1 - e2| per dimension over all pairs."""
+        if not pairs:
+            return np.zeros(self.dim)
+        first, second = (np.stack(side) for side in zip(*pairs))
+        return np.abs(first - second).sum(axis=0, dtype=np.float64)
+
     def apply_weights(self, embeddings: np.ndarray) -> np.ndarray:
         """Apply learned dimension weights to embeddings."""
-        weighted = embeddings * self.weights
-        # Re-normalize
-        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
-        return weighted / (norms + 1e-8)
+        weighted = _coerce(embeddings) * self.weights
+        # Re-normalize in place: the product is already a fresh array
+        norms = np.sqrt(np.einsum('ij,ij->i', weighted, weighted))
+        weighted /= (norms + 1e-8)[:, np.newaxis]
+        return weighted
 
     def focus_on_concept(self, embeddings: np.ndarray,
                          concept: str, strength: float = 1.5) -> np.ndarray:
@@ -565,12 +745,20 @@ class EmbeddingSurgeon:
         if concept not in self.dimension_roles:
             return embeddings
 
-        # Boost relevant dimensions
-        concept_weights = 1.0 + (self.dimension_roles[concept] * strength)
+        # Boost relevant dimensions; the weights are cached per
+        # (concept, strength) until dimension_roles is replaced
+        if self._focus_roles is not self.dimension_roles:
+            self._focus_cache.clear()
+            self._focus_roles = self.dimension_roles
+        key = (concept, strength)
+        if key not in self._focus_cache:
+            self._focus_cache[key] = 1.0 + (self.dimension_roles[concept] * strength)
+        concept_weights = self._focus_cache[key]
 
         weighted = embeddings * concept_weights
-        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
-        return weighted / (norms + 1e-8)
+        norms = np.sqrt(np.einsum('ij,ij->i', weighted, weighted))
+        weighted /= (norms + 1e-8)[:, np.newaxis]
+        return weighted
 
 
 # =============================================================================
@@ -599,7 +787,10 @@ class EmbeddingEnsemble:
     def add_embeddings(self, model_name: str,
                        translator_embeddings: Dict[str, np.ndarray]):
         """Add embeddings from a specific model."""
-        self.embeddings[model_name] = translator_embeddings
+        self.embeddings[model_name] = {
+            name: _coerce(emb)
+            for name, emb in translator_embeddings.items()
+        }
         self.weights[model_name] = 1.0
 
     def set_model_weight(self, model_name: str, weight: float):
@@ -648,6 +839,45 @@ class EmbeddingEnsemble:
 
         return float(np.std(similarities))
 
+    def _pair_similarities(self, translator1: str, translator2: str) -> np.ndarray:
+        """
+        (n_models, n_aphorisms) similarities between two translations.
+
+        Models may differ in dimension, so each is one row-wise einsum over
+        that model's own arrays rather than a slice of a single stack.
+        """
+        return np.stack([
+            np.einsum('ij,ij->i', trans_embs[translator1], trans_embs[translator2])
+            for trans_embs in self.embeddings.values()
+        ])
+
+    def weighted_similarities(self, translator1: str, translator2: str) -> np.ndarray:
+        """
+        weighted_similarity for every aphorism at once.
+        """
+        if not self.embeddings:
+            return np.zeros(0)
+
+        similarities = self._pair_similarities(translator1, translator2)
+        weights = np.array([self.weights.get(name, 1.0) for name in self.embeddings])
+        total_weight = weights.sum()
+
+        if total_weight <= 0:
+            return np.zeros(similarities.shape[1])
+        return (weights @ similarities) / total_weight
+
+    def disagreement_scores(self, translator1: str, translator2: str) -> np.ndarray:
+        """
+        disagreement_score for every aphorism at once.
+        """
+        if not self.embeddings:
+            return np.zeros(0)
+
+        similarities = self._pair_similarities(translator1, translator2)
+        if len(similarities) < 2:
+            return np.zeros(similarities.shape[1])
+        return similarities.std(axis=0, dtype=np.float64)
+
     def rank_fusion(self, query_emb: np.ndarray,
                     candidate_embs: np.ndarray,
                     method: str = "rrf") -> np.ndarray:
@@ -660,24 +890,32 @@ class EmbeddingEnsemble:
 
         Returns: Fused ranking scores for each candidate.
         """
+        candidate_embs = _coerce(candidate_embs)
         n_candidates = candidate_embs.shape[0]
         fused_scores = np.zeros(n_candidates)
 
-        for model_name, trans_embs in self.embeddings.items():
-            # This is simplified - in practice you'd pass model-specific embeddings
-            # For now, just demonstrate the fusion logic
-            similarities = candidate_embs @ query_emb
-            ranks = np.argsort(-similarities)  # Higher sim = lower rank
-
-            if method == "rrf":
-                # RRF: score = sum(1 / (k + rank)) where k=60 is standard
-                k = 60
-                for rank, idx in enumerate(ranks):
-                    fused_scores[idx] += 1.0 / (k + rank)
-            elif method == "borda":
-                # Borda: score = n_candidates - rank
-                for rank, idx in enumerate(ranks):
-                    fused_scores[idx] += n_candidates - rank
+        # Score for each rank position, the same for every model
+        positions = np.arange(n_candidates)
+        if method == "rrf":
+            # RRF: score = sum(1 / (k + rank)) where k=60 is standard
+            k = 60
+            rank_scores = 1.0 / (k + positions)
+        elif method == "borda":
+            # Borda: score = n_candidates - rank
+            rank_scores = n_candidates - positions
+        else:
+            return fused_scores
+        if not self.embeddings:
+            return fused_scores
+
+        # This is simplified - in practice you'd pass model-specific embeddings.
+        # For now, just demonstrate the fusion logic: every model sees the same
+        # similarities, so rank once and count that ranking once per model
+        similarities = candidate_embs @ _coerce(query_emb)
+        ranks = np.argsort(-similarities)  # Higher sim = lower rank
+
+        # ranks is a permutation, so each candidate is scored once
+        fused_scores[ranks] = rank_scores * len(self.embeddings)
 
         return fused_scores
 
@@ -711,6 +949,11 @@ class ZeroShotAdapter:
             ("creation", "reaction"),
         ]
 
+        # Anchor matrix for the last concept_anchors dict seen, see _prepare_anchors
+        self._anchor_source = None
+        self._anchor_names = []
+        self._anchor_matrix = None
+
     def create_concept_anchors(self, embedder) -> Dict[str, np.ndarray]:
         """
         Create anchor embeddings for key concepts using definitions.
@@ -736,6 +979,19 @@ class ZeroShotAdapter:
 
         return {name: emb for name, emb in zip(concept_definitions.keys(), embeddings)}
 
+    def _prepare_anchors(self, concept_anchors: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Stack concept_anchors into a (n_anchors, d) matrix, once per dict.
+
+        The matrix is reused while the same dict object is passed; pass a new
+        dict (e.g. from create_concept_anchors) rather than mutating one.
+        """
+        if concept_anchors is not self._anchor_source:
+            self._anchor_names = list(concept_anchors)
+            self._anchor_matrix = np.array(list(concept_anchors.values()))
+            self._anchor_source = concept_anchors
+        return self._anchor_matrix
+
     def semantic_neighborhood_adjustment(self,
                                           embeddings: np.ndarray,
                                           concept_anchors: Dict[str, np.ndarray]) -> np.ndarray:
@@ -745,24 +1001,21 @@ class ZeroShotAdapter:
         Embeddings near known concept anchors are pulled slightly closer
         to those anchors, reinforcing conceptual clustering.
         """
-        anchors = np.array(list(concept_anchors.values()))
+        anchors = self._prepare_anchors(concept_anchors)
 
-        adjusted = embeddings.copy()
+        # Find nearest anchor for every embedding at once
+        similarities = embeddings @ anchors.T  # (n, n_anchors)
+        nearest_idx = similarities.argmax(axis=1)
+        nearest_sim = similarities[np.arange(len(embeddings)), nearest_idx]
 
-        for i in range(len(embeddings)):
-            # Find nearest anchor
-            similarities = embeddings[i] @ anchors.T
-            nearest_idx = similarities.argmax()
-            nearest_sim = similarities[nearest_idx]
-
-            if nearest_sim > 0.5:  # Only adjust if reasonably close
-                # Pull slightly toward anchor
-                pull_strength = 0.1 * (nearest_sim - 0.5)
-                adjusted[i] = (1 - pull_strength) * embeddings[i] + pull_strength * anchors[nearest_idx]
+        # Pull slightly toward anchor, only if reasonably close
+        pull_strength = np.where(nearest_sim > 0.5, 0.1 * (nearest_sim - 0.5), 0.0)
+        pull_strength = pull_strength[:, np.newaxis]
+        adjusted = (1 - pull_strength) * embeddings + pull_strength * anchors[nearest_idx]
 
         # Re-normalize
-        norms = np.linalg.norm(adjusted, axis=1, keepdims=True)
-        adjusted = adjusted / (norms + 1e-8)
+        norms = np.sqrt(np.einsum('ij,ij->i', adjusted, adjusted))
+        adjusted /= (norms + 1e-8)[:, np.newaxis]
 
         return adjusted
 
@@ -783,8 +1036,8 @@ class ZeroShotAdapter:
             negative_pairs: Indices of embeddings that should be dissimilar
         """
         # Compute current similarities for known pairs
-        pos_sims = [float(embeddings[i] @ embeddings[j]) for i, j in positive_pairs]
-        neg_sims = [float(embeddings[i] @ embeddings[j]) for i, j in negative_pairs]
+        pos_sims = pair_similarities(embeddings, positive_pairs)
+        neg_sims = pair_similarities(embeddings, negative_pairs)
 
         # Target: positives should be > 0.7, negatives should be < 0.3
         pos_target = 0.8
@@ -794,12 +1047,20 @@ class ZeroShotAdapter:
         # new_sim = a * old_sim + b
         # Solve for a, b using least squares
 
-        old_sims = np.array(pos_sims + neg_sims)
-        targets = np.array([pos_target] * len(pos_sims) + [neg_target] * len(neg_sims))
-
-        # Linear regression
-        A = np.vstack([old_sims, np.ones(len(old_sims))]).T
-        a, b = np.linalg.lstsq(A, targets, rcond=None)[0]
+        old_sims = np.concatenate([pos_sims, neg_sims]).astype(np.float64)
+        targets = np.concatenate([np.full(len(pos_sims), pos_target),
+                                  np.full(len(neg_sims), neg_target)])
+
+        # Linear regression: with two parameters the least-squares fit has
+        # a closed form, a = cov(x, y) / var(x) and b = mean(y) - a * mean(x)
+        if len(old_sims) > 1 and np.ptp(old_sims) > 0:
+            x_dev = old_sims - old_sims.mean()
+            a = (x_dev @ (targets - targets.mean())) / (x_dev @ x_dev)
+            b = targets.mean() - a * old_sims.mean()
+        else:
+            # No spread in x: keep lstsq's minimum-norm answer
+            A = np.vstack([old_sims, np.ones(len(old_sims))]).T
+            a, b = np.linalg.lstsq(A, targets, rcond=None)[0]
 
         print(f"Learned rescaling: new_sim = {a:.3f} * old_sim + {b:.3f}")
 
@@ -872,31 +1133,69 @@ class DomainAdaptedEmbedder:
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def diagnose_embedding_quality(embeddings: np.ndarray, labels: List[str] = None) -> Dict:
+def pair_similarities(embeddings: np.ndarray, pairs: List[Tuple[int, int]]) -> np.ndarray:
+    """
+    Similarity embeddings[i] @ embeddings[j] for each (i, j) in pairs,
+    as one gather and row-wise einsum instead of a dot product per pair.
+    """
+    if len(pairs) == 0:
+        return np.zeros(0, dtype=embeddings.dtype)
+    idx = np.asarray(pairs)
+    return np.einsum('ij,ij->i', embeddings[idx[:, 0]], embeddings[idx[:, 1]])
+
+
+def diagnose_embedding_quality(embeddings: np.ndarray, labels: List[str] = None,
+                               block_size: int = 256) -> Dict:
     """
     Diagnose common issues with embedding quality.
 
     Returns metrics that indicate potential problems.
+
+    The (n, n) similarity matrix is never held in full: it is computed
+    block_size rows at a time, so memory is O(block_size * n).
     """
     calibrator = EmbeddingCalibrator()
 
-    # Compute similarity matrix
-    sim_matrix = embeddings @ embeddings.T
-    np.fill_diagonal(sim_matrix, 0)  # Ignore self-similarity
+    n = len(embeddings)
+    nearest = []
+    nearest_sim = []
+    count, mean, m2 = 0, 0.0, 0.0
+
+    for start in range(0, n, block_size):
+        # Similarities of this block of rows to every point
+        block = embeddings[start:start + block_size] @ embeddings.T
+        rows = np.arange(len(block))
+        block[rows, start + rows] = 0  # Ignore self-similarity
+
+        # Each point's nearest neighbor; the overall max is the largest of
+        # their similarities
+        block_nearest = block.argmax(axis=1)
+        nearest.append(block_nearest)
+        nearest_sim.append(block[rows, block_nearest])
+
+        # Merge the block's mean and sum of squared deviations into the
+        # running totals (Chan et al.), for a stable overall std
+        block_mean = float(block.mean(dtype=np.float64))
+        block_m2 = float(np.square(block - block_mean).sum(dtype=np.float64))
+        total = count + block.size
+        delta = block_mean - mean
+        mean += delta * block.size / total
+        m2 += block_m2 + delta ** 2 * count * block.size / total
+        count = total
+
+    nearest = np.concatenate(nearest)
+    nearest_sim = np.concatenate(nearest_sim)
 
     # Metrics
     metrics = {
         "isotropy_score": calibrator.isotropy_score(embeddings),
-        "mean_similarity": float(sim_matrix.mean()),
-        "max_off_diagonal_similarity": float(sim_matrix.max()),
-        "similarity_std": float(sim_matrix.std()),
+        "mean_similarity": mean,
+        "max_off_diagonal_similarity": float(nearest_sim.max()),
+        "similarity_std": float(np.sqrt(m2 / count)),
     }
 
     # Hubness: how often each point is a nearest neighbor
-    nn_counts = np.zeros(len(embeddings))
-    for i in range(len(embeddings)):
-        nn = sim_matrix[i].argmax()
-        nn_counts[nn] += 1
+    nn_counts = np.bincount(nearest, minlength=n)
 
     metrics["hubness_max"] = int(nn_counts.max())
     metrics["hubness_std"] = float(nn_counts.std())
@@ -927,9 +1226,14 @@ def compare_calibration_methods(embeddings: np.ndarray,
     """
     calibrator = EmbeddingCalibrator()
 
+    # Whitening decomposes the original embeddings anyway; read their
+    # isotropy from that SVD rather than running another one
+    whitened, svals = calibrator.whiten(embeddings, return_singular_values=True)
+    isotropy = {"original": calibrator.isotropy_from_singular_values(svals)}
+
     methods = {
         "original": embeddings,
-        "whitened": calibrator.whiten(embeddings),
+        "whitened": whitened,
         "pc_removed_1": calibrator.remove_principal_components(embeddings, 1),
         "pc_removed_2": calibrator.remove_principal_components(embeddings, 2),
     }
@@ -938,19 +1242,19 @@ def compare_calibration_methods(embeddings: np.ndarray,
 
     for name, emb in methods.items():
         # Compute similarities for known pairs
-        sim_similar = [float(emb[i] @ emb[j]) for i, j in known_similar]
-        sim_different = [float(emb[i] @ emb[j]) for i, j in known_different]
+        sim_similar = pair_similarities(emb, known_similar)
+        sim_different = pair_similarities(emb, known_different)
 
         # Quality metrics
-        mean_similar = np.mean(sim_similar)
-        mean_different = np.mean(sim_different)
+        mean_similar = np.mean(sim_similar, dtype=np.float64)
+        mean_different = np.mean(sim_different, dtype=np.float64)
         separation = mean_similar - mean_different
 
         results[name] = {
             "mean_similar_pair_sim": float(mean_similar),
             "mean_different_pair_sim": float(mean_different),
             "separation": float(separation),
-            "isotropy": calibrator.isotropy_score(emb),
+            "isotropy": isotropy[name] if name in isotropy else calibrator.isotropy_score(emb),
         }
 
     return results
@@ -8,6 +8,15 @@ import numpy as np
 from pathlib import Path
 from sentence_transformers import SentenceTransformer
 
+try:
+    import simsimd
+
+    def _rowwise_cosine(a, b):
+        # simsimd returns one cosine distance per aligned pair of rows
+        return 1.0 - np.asarray(simsimd.cosine(a, b), dtype=np.float32)
+except ImportError:
+    _rowwise_cosine = None
+
 
 # E5 models need prefixes
 def add_prefix(texts: list[str], prefix: str = "passage") -> list[str]:
@@ -31,10 +40,12 @@ class Embedder:
         self.model = SentenceTransformer(model_name)
         self.uses_prefix = "e5" in model_name.lower()
 
-    def embed(self, texts: list[str], is_query: bool = False) -> np.ndarray:
+    def embed(self, texts: list[str], is_query: bool = False,
+              batch_size: int = 32) -> np.ndarray:
         """
         Embed a list of texts.
         For E5: use is_query=True for the source (German), False for translations.
+        Larger batch_size values fill the model better when embedding many texts.
         """
         if self.uses_prefix:
             prefix = "query" if is_query else "passage"
@@ -42,6 +53,8 @@ class Embedder:
 
         return self.model.encode(
             texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
             normalize_embeddings=True,
             show_progress_bar=True
         )
@@ -49,7 +62,10 @@ class Embedder:
 
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> np.ndarray:
     """Cosine similarity between aligned vectors (already normalized)."""
-    return np.sum(a * b, axis=1)
+    if _rowwise_cosine is not None and a.dtype == b.dtype == np.float32:
+        return _rowwise_cosine(np.ascontiguousarray(a), np.ascontiguousarray(b))
+    # Row-wise dot products without materializing a * b
+    return np.einsum('nd,nd->n', a, b)
 
 
 def load_aligned_corpus(corpus_dir: str = "corpus/aligned") -> dict:
@@ -129,15 +145,20 @@ if __name__ == "__main__":
     # Initialize embedder
     embedder = Embedder()
 
-    # Embed each translator's aphorisms
+    # Embed every translator's aphorisms in one batch, then split back out
     aphorism_nums = sorted(aligned.keys())
-    embeddings = {}
+    all_texts = []
+    offsets = {}
 
     for name in corpus.keys():
         texts = [aligned[n].get(name, "") for n in aphorism_nums]
-        texts = [t if t else "[MISSING]" for t in texts]
-        print(f"Embedding {name}...")
-        embeddings[name] = embedder.embed(texts)
+        start = len(all_texts)
+        all_texts.extend(t if t else "[MISSING]" for t in texts)
+        offsets[name] = (start, len(all_texts))
+
+    print(f"Embedding {len(all_texts)} texts from {len(offsets)} translations...")
+    flat = embedder.embed(all_texts, batch_size=64)
+    embeddings = {name: flat[start:end] for name, (start, end) in offsets.items()}
 
     # Compute pairwise similarities
     print("\n" + "=" * 50)
@@ -152,8 +173,10 @@ if __name__ == "__main__":
     out_dir = Path("outputs/embeddings")
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    # Stored as float16: half the bytes to write and read back, and cosine
+    # similarities of the normalized vectors barely move. Readers upcast.
     for name, emb in embeddings.items():
-        np.save(out_dir / f"{name.replace(' ', '_').lower()}.npy", emb)
+        np.save(out_dir / f"{name.replace(' ', '_').lower()}.npy", emb.astype(np.float16))
 
     # Save aphorism index
     with open(out_dir / "index.json", "w") as f:
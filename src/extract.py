@@ -8,6 +8,10 @@ import json
 from pathlib import Path
 
 
+# Number at start of line, followed by content up to the next number
+APHORISM_PATTERN = re.compile(r'(?:^|\n)\s*(\d{1,3})\s*\n(.+?)(?=\n\s*\d{1,3}\s*\n|$)', re.DOTALL)
+
+
 def extract_pdf(pdf_path: str) -> str:
     """Extract all text from a PDF."""
     doc = fitz.open(pdf_path)
@@ -43,10 +47,7 @@ def parse_aphorisms(text: str) -> list[dict]:
     Returns list of {number, text} dicts.
     """
     # BGE has 296 aphorisms, numbered 1-296
-    # Pattern: number at start of line, followed by content
-    pattern = r'(?:^|\n)\s*(\d{1,3})\s*\n(.+?)(?=\n\s*\d{1,3}\s*\n|$)'
-
-    matches = re.findall(pattern, text, re.DOTALL)
+    matches = APHORISM_PATTERN.findall(text)
 
     aphorisms = []
     for num_str, content in matches:
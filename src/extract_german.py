@@ -9,6 +9,24 @@ import json
 from pathlib import Path
 
 
+# Number (1-296) followed by period, then content until next number.
+# The (?=...) is a lookahead to stop at the next aphorism number
+APHORISM_PATTERN = re.compile(
+    r'(?:^|\n)\s*(\d{1,3})\.\s*\n?(.*?)(?=\n\s*\d{1,3}\.\s*\n|\n\s*\d{1,3}\.\s*[A-Z]|$)',
+    re.DOTALL
+)
+# Match: newline(s), number, period, space or newline
+SPLIT_PATTERN = re.compile(r'\n\s*(\d{1,3})\.\s*\n?')
+
+# Chapter headings and trailing material that leak into aphorism text
+HEADING_LINE_PATTERN = re.compile(r'^.*Hauptstück:.*$', re.MULTILINE)
+CHAPTER_PATTERN = re.compile(
+    r'(Erstes|Zweites|Drittes|Viertes|Fünftes|Sechstes|Siebentes|Achtes|Neuntes)\s+Hauptstück:.*?(?=\n|$)',
+    re.DOTALL
+)
+EPILOGUE_PATTERN = re.compile(r'Aus hohen Bergen\..*', re.DOTALL)
+
+
 def extract_full_text(pdf_path: str) -> str:
     """Extract all text from PDF."""
     doc = fitz.open(pdf_path)
@@ -53,12 +71,8 @@ def extract_aphorisms(text: str) -> list[dict]:
     """
     aphorisms = []
 
-    # Pattern: number (1-296) followed by period, then content until next number
-    # The (?=...) is a lookahead to stop at the next aphorism number
-    pattern = r'(?:^|\n)\s*(\d{1,3})\.\s*\n?(.*?)(?=\n\s*\d{1,3}\.\s*\n|\n\s*\d{1,3}\.\s*[A-Z]|$)'
-
     # First pass: try to get everything
-    matches = re.findall(pattern, text, re.DOTALL)
+    matches = APHORISM_PATTERN.findall(text)
 
     for num_str, content in matches:
         num = int(num_str)
@@ -66,7 +80,7 @@ def extract_aphorisms(text: str) -> list[dict]:
             # Clean up the content
             content = content.strip()
             # Remove chapter headings that got included
-            content = re.sub(r'^.*Hauptstück:.*$', '', content, flags=re.MULTILINE)
+            content = HEADING_LINE_PATTERN.sub('', content)
             content = content.strip()
 
             if len(content) > 20:  # Must have actual content
@@ -90,8 +104,7 @@ def extract_with_split_method(text: str) -> list[dict]:
     aphorisms = []
 
     # Split text on aphorism number pattern
-    # Match: newline(s), number, period, space or newline
-    parts = re.split(r'\n\s*(\d{1,3})\.\s*\n?', text)
+    parts = SPLIT_PATTERN.split(text)
 
     # parts[0] is before first number
     # parts[1] is first number, parts[2] is its content
@@ -105,13 +118,8 @@ def extract_with_split_method(text: str) -> list[dict]:
 
             if 1 <= num <= 296 and len(content.strip()) > 20:
                 # Clean content: remove chapter headings
-                content = re.sub(
-                    r'(Erstes|Zweites|Drittes|Viertes|Fünftes|Sechstes|Siebentes|Achtes|Neuntes)\s+Hauptstück:.*?(?=\n|$)',
-                    '',
-                    content,
-                    flags=re.DOTALL
-                )
-                content = re.sub(r'Aus hohen Bergen\..*', '', content, flags=re.DOTALL)
+                content = CHAPTER_PATTERN.sub('', content)
+                content = EPILOGUE_PATTERN.sub('', content)
                 content = content.strip()
 
                 if len(content) > 20:
@@ -233,12 +233,12 @@ def is_valid(text: str, is_german: bool = False) -> bool:
 def compute_divergences(n_aphorisms: int) -> list:
     """Compute divergence (std of pairwise similarities) for each aphorism"""
     embeddings = [
-        np.load(EMBEDDINGS_DIR / 'gutenberg.npy'),
-        np.load(EMBEDDINGS_DIR / 'rj_hollingdale.npy'),
-        np.load(EMBEDDINGS_DIR / 'walter_kaufman.npy'),
-        np.load(EMBEDDINGS_DIR / 'marion_faber.npy'),
-        np.load(EMBEDDINGS_DIR / 'judith_norman.npy'),
-        np.load(EMBEDDINGS_DIR / 'helen_zimmern.npy'),
+        np.load(EMBEDDINGS_DIR / 'gutenberg.npy').astype(np.float32, copy=False),
+        np.load(EMBEDDINGS_DIR / 'rj_hollingdale.npy').astype(np.float32, copy=False),
+        np.load(EMBEDDINGS_DIR / 'walter_kaufman.npy').astype(np.float32, copy=False),
+        np.load(EMBEDDINGS_DIR / 'marion_faber.npy').astype(np.float32, copy=False),
+        np.load(EMBEDDINGS_DIR / 'judith_norman.npy').astype(np.float32, copy=False),
+        np.load(EMBEDDINGS_DIR / 'helen_zimmern.npy').astype(np.float32, copy=False),
     ]
 
     divergences = []